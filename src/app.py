@@ -1,11 +1,21 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import fitz  # PyMuPDF
-from typing import Optional
+from typing import Dict, List, Optional, Union
 from streamlit.runtime.uploaded_file_manager import UploadedFile
 
 from src import PDFParser, HTMLToJsonConverter, MetadataEnhancedJsonConverter
 
 
+@st.cache_data(show_spinner=False, max_entries=16, ttl="1h")
+def _parse_pdf_cached(pdf_bytes: bytes) -> List[Dict[str, Union[int, List[str]]]]:
+    """ Parses PDF bytes into page data, cached (bounded in size and age) so reruns with the same file skip parsing. """
+    doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+    return PDFParser(doc).process_document()
+
+
 class PDFToJsonConverterApp:
     def __init__(self, default_url: str = "https://example.com/"):
         """ Initialize the application with a default URL. """
@@ -22,19 +32,34 @@ class PDFToJsonConverterApp:
     def process_pdf_to_json(self, uploaded_file: UploadedFile, base_url: str) -> Optional[str]:
         """ Converts a PDF file to JSON format. """
         try:
-            doc = fitz.open(stream=uploaded_file.read(), filetype="pdf")
-            pdf_parser = PDFParser(doc)
-            all_pages_data = pdf_parser.process_document()
+            all_pages_data = self._parse_pdf_in_background(uploaded_file.getvalue())
 
             html_converter = HTMLToJsonConverter(all_pages_data)
-            raw_json_output = html_converter.process_list_to_json()
+            structured_data = html_converter.process_list_to_structured()
 
-            metadata_processor = MetadataEnhancedJsonConverter(raw_json_output, uploaded_file.name, base_url)
+            metadata_processor = MetadataEnhancedJsonConverter(structured_data, uploaded_file.name, base_url)
             return metadata_processor.get_enhanced_json()
         except Exception as e:
             st.error(f'An error occurred: {e}')
             return None
 
+    def _parse_pdf_in_background(self, pdf_bytes: bytes) -> List[Dict[str, Union[int, List[str]]]]:
+        """ Parses the PDF in a worker thread, updating a status line until parsing finishes. """
+        status = st.empty()
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            future = executor.submit(_parse_pdf_cached, pdf_bytes)
+            while not future.done():
+                # Streamlit raises here when a rerun is requested, ending this run immediately
+                status.caption(f"Parsing PDF... {time.monotonic() - started:.0f}s")
+                time.sleep(0.1)
+        finally:
+            # Don't wait on an interrupted parse; it finishes in the background and fills the cache
+            executor.shutdown(wait=False)
+        status.empty()
+        return future.result()
+
     def display_json_output(self, json_output: str) -> None:
         """ Displays the JSON output in a text area. """
         st.text_area("JSON Output", json_output, height=300)
@@ -1,10 +1,16 @@
 import os
 
 import fitz  # PyMuPDF
-import json
+import orjson
 import re
 from collections import defaultdict
-from typing import Union, List, Dict, Tuple
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, Iterator, Optional, Union, List, Dict, Tuple
+
+_H_MATCH = re.compile(r'<h\d>')
+_H_SUB = re.compile(r'</?h\d>')
+_P_SUB = re.compile(r'</?p>')
 
 
 class PDFParser:
@@ -14,7 +20,15 @@ class PDFParser:
 
     Attributes:
         doc (fitz.Document): The PDF document to be parsed.
+        _TEXT_FLAGS (int): Text extraction flags; PyMuPDF's defaults for "dict" without image blocks.
+        _CLOSING (Dict[str, str]): Closing tags for the opening tags most commonly produced by the size tag map.
+        _size_tag_cache (Dict[Tuple[frozenset, tuple], Dict[tuple, str]]): Size tag maps already built for
+            this document, keyed by the page's font set and primary style.
     """
+    _TEXT_FLAGS = fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES
+    _CLOSING = {'<p>': '</p>', '<h1>': '</h1>', '<h2>': '</h2>', '<h3>': '</h3>',
+                '<h4>': '</h4>', '<h5>': '</h5>', '<h6>': '</h6>'}
+
     def __init__(self, doc: fitz.Document):
         """
         Initializes the PDFParser with a PDF document.
@@ -23,6 +37,7 @@ class PDFParser:
             doc (fitz.Document): The PDF document to be parsed.
         """
         self.doc = doc
+        self._size_tag_cache: Dict[Tuple[frozenset, tuple], Dict[tuple, str]] = {}
 
     def process_document(self) -> List[Dict[str, Union[int, List[str]]]]:
         """
@@ -31,41 +46,81 @@ class PDFParser:
         Returns:
             List[Dict[str, Union[int, List[str]]]]: A list of dictionaries, each representing a page with its content.
         """
-        html_pages_list = []
-        for page in self.doc:
-            font_counts, styles = self._extract_fonts(page, granularity=True)
-            size_tag = self._create_size_tag_map(font_counts, styles)
-            headers_paragraphs = self._extract_page_content(page, size_tag)
-            html_pages_list.append({"page": page.number, "content": headers_paragraphs})
-        return html_pages_list
+        return [self._process_page(page) for page in self.doc]
 
-    def _extract_fonts(self, page: fitz.Page, granularity: bool = False) -> Tuple[Dict[str, int], Dict[str, dict]]:
+    def _process_page(self, page: fitz.Page) -> Dict[str, Union[int, List[str]]]:
         """
-        Extracts fonts and their usage frequencies from a single PDF page.
+        Processes a single page of the PDF document. Pages are processed one at a time on the
+        calling thread, as PyMuPDF does not support concurrent access to a document.
 
         Args:
             page (fitz.Page): A single page of a PDF document.
-            granularity (bool): Flag to determine the level of detail for font extraction.
 
         Returns:
-            Tuple[Dict[str, int], Dict[str, dict]]: A tuple containing font counts and styles.
+            Dict[str, Union[int, List[str]]]: A dictionary representing the page with its content.
         """
-        styles = {}
-        font_counts = defaultdict(int)
+        blocks = self._get_text_blocks(page)
+        primary_identifier, styles = self._extract_fonts_from_blocks(blocks)
+        if primary_identifier is None:
+            raise ValueError("No fonts found on page {}".format(page.number))
+        size_tag = self._get_size_tag_map(primary_identifier, styles)
+        headers_paragraphs = self._extract_page_content_from_blocks(blocks, size_tag)
+        return {"page": page.number, "content": headers_paragraphs}
 
-        for block in page.get_text("dict")["blocks"]:
-            if block['type'] == 0:
-                for line in block["lines"]:
-                    for span in line["spans"]:
-                        identifier = self._create_identifier(span, granularity)
-                        styles[identifier] = self._extract_style(span, granularity)
-                        font_counts[identifier] += 1
+    def _get_text_blocks(self, page: fitz.Page) -> List[dict]:
+        """
+        Extracts the text blocks of a single PDF page. The page's TextPage is bound explicitly so
+        that any further extraction formats for the page can reuse it instead of building another.
 
-        if not font_counts:
+        Args:
+            page (fitz.Page): A single page of a PDF document.
+
+        Returns:
+            List[dict]: The text blocks of the page, in the layout of page.get_text("dict").
+        """
+        text_page = page.get_textpage(flags=self._TEXT_FLAGS)
+        return text_page.extractDICT()["blocks"]
+
+    def _extract_fonts(self, page: fitz.Page) -> Tuple[tuple, Dict[tuple, dict]]:
+        """
+        Extracts fonts and the most frequently used font from a single PDF page.
+
+        Args:
+            page (fitz.Page): A single page of a PDF document.
+
+        Returns:
+            Tuple[tuple, Dict[tuple, dict]]: A tuple containing the primary font identifier and styles.
+        """
+        primary_identifier, styles = self._extract_fonts_from_blocks(self._get_text_blocks(page))
+        if primary_identifier is None:
             raise ValueError("No fonts found on page {}".format(page.number))
+        return primary_identifier, styles
+
+    def _extract_fonts_from_blocks(self, blocks: List[dict]) -> Tuple[Optional[tuple], Dict[tuple, dict]]:
+        """
+        Extracts fonts and the most frequently used font from the text blocks of a single PDF page.
 
-        sorted_font_counts = sorted(font_counts.items(), key=lambda x: x[1], reverse=True)
-        return sorted_font_counts, styles
+        Args:
+            blocks (List[dict]): Text blocks returned by _get_text_blocks.
+
+        Returns:
+            Tuple[Optional[tuple], Dict[tuple, dict]]: A tuple containing the primary font identifier
+                                                       (None if the blocks contain no spans) and styles.
+        """
+        styles = {}
+        font_counts = defaultdict(int)
+
+        for block in blocks:
+            for line in block["lines"]:
+                for span in line["spans"]:
+                    identifier = (span['size'], span['font'], span['color'])
+                    if identifier not in styles:
+                        styles[identifier] = {'size': identifier[0], 'font': identifier[1], 'color': identifier[2]}
+                    font_counts[identifier] += 1
+
+        # max() keeps the first identifier seen among equally frequent ones, as a stable sort would
+        primary_identifier = max(font_counts, key=font_counts.get) if font_counts else None
+        return primary_identifier, styles
 
     def _determine_tag(self, size, font, color, primary_style, header_idx, subheader_idx) -> Tuple[str, int, int]:
         """
@@ -91,181 +146,161 @@ class PDFParser:
         else:
             return '<p>', header_idx, subheader_idx
 
-    def _create_size_tag_map(self, font_counts: Dict[str, int], styles: Dict[str, dict]) -> Dict[str, str]:
+    def _get_size_tag_map(self, primary_identifier: tuple, styles: Dict[tuple, dict]) -> Dict[tuple, str]:
         """
-        Creates a map of font styles to HTML tags based on the provided font counts and styles.
+        Returns the size tag map for a page, reusing a previously built map when the page uses
+        the same set of font styles and the same primary style as an earlier page.
+
+        Args:
+            primary_identifier (tuple): Identifier of the most frequently used font style.
+            styles (Dict[tuple, dict]): A dictionary mapping font identifiers to their style attributes.
+
+        Returns:
+            Dict[tuple, str]: A map linking font styles to HTML tags.
+        """
+        unique_styles = frozenset((style['size'], style['font'], style['color']) for style in styles.values())
+        key = (unique_styles, primary_identifier)
+        size_tag_map = self._size_tag_cache.get(key)
+        if size_tag_map is None:
+            size_tag_map = self._create_size_tag_map(primary_identifier, styles)
+            self._size_tag_cache[key] = size_tag_map
+        return size_tag_map
+
+    def _create_size_tag_map(self, primary_identifier: tuple, styles: Dict[tuple, dict]) -> Dict[tuple, str]:
+        """
+        Creates a map of font styles to HTML tags based on the provided primary style and styles.
         This method is used to generate a dictionary where each unique font style is associated
         with an appropriate HTML tag (like 'h1', 'h2', etc.). The method sorts the styles
         primarily by font size and then applies specific rules to determine the corresponding
         HTML tag for each style.
 
         The method works by first extracting the 'p' style from the styles dictionary using
-        the most frequent font style from font_counts. Then, it creates a set of unique styles
+        the most frequent font style, primary_identifier. Then, it creates a set of unique styles
         (tuples of size, font, and color). These styles are sorted primarily by size in
         descending order. For each unique style, the method determines the appropriate HTML tag
         by considering its size, font, and color relative to the 'p' style and other factors like
         the number of headers and subheaders already assigned.
 
         Args:
-            font_counts (Dict[str, int]): A dictionary where keys are font identifiers and
-                                          values are counts of how often each font appears.
-                                          Used to identify the most common font style.
-            styles (Dict[str, dict]): A dictionary mapping font identifiers to their style
-                                      attributes (like size, font, and color).
+            primary_identifier (tuple): Identifier of the most common font style on the page.
+            styles (Dict[tuple, dict]): A dictionary mapping font identifiers to their style
+                                        attributes (like size, font, and color).
 
         Returns:
-            Dict[str, str]: A dictionary where keys are strings representing the unique combination
-                            of style attributes (size, font, color) and values are the corresponding
-                            HTML tags. This map links each unique style to an HTML tag, indicating
-                            how it should be rendered in HTML format.
+            Dict[tuple, str]: A dictionary where keys are tuples representing the unique combination
+                              of style attributes (size, font, color) and values are the corresponding
+                              HTML tags. This map links each unique style to an HTML tag, indicating
+                              how it should be rendered in HTML format.
         """
-        primary_style = styles[font_counts[0][0]]
+        primary_style = styles[primary_identifier]
         unique_styles = {(style['size'], style['font'], style['color']) for style in styles.values()}
         sorted_unique_styles = sorted(unique_styles, key=lambda x: (-x[0], x[1], x[2]))  # Sort primarily by size
 
         size_tag_map = {}
         header_idx, subheader_idx = 1, 1
         for style in sorted_unique_styles:
-            identifier = f"{style[0]}_{style[1]}_{style[2]}"
             tag, header_idx, subheader_idx = self._determine_tag(*style, primary_style, header_idx, subheader_idx)
-            size_tag_map[identifier] = tag
+            size_tag_map[style] = tag
 
         return size_tag_map
 
-    def _extract_page_content(self, page: fitz.Page, size_tag_map: Dict[str, str]) -> List[str]:
+    def _extract_page_content(self, page: fitz.Page, size_tag_map: Dict[tuple, str]) -> List[str]:
         """
         Extracts content from a single PDF page.
 
         Args:
             page (fitz.Page): A single page of a PDF document.
-            size_tag_map (Dict[str, str]): A map linking font styles to HTML tags.
+            size_tag_map (Dict[tuple, str]): A map linking font styles to HTML tags.
 
         Returns:
             List[str]: A list of headers and paragraphs as HTML strings.
         """
-        page_blocks = []
-        for block in page.get_text("dict")["blocks"]:
-            if block['type'] == 0:
-                block_string = self._process_block(block, size_tag_map)
-                if block_string:
-                    page_blocks.append(block_string)
-        return page_blocks
-
-    def _create_identifier(self, span: dict, granularity: bool) -> str:
-        """
-        Creates an identifier for a text span based on its style.
-
-        Args:
-            span (dict): Text span containing style information.
-            granularity (bool): Flag to determine the level of detail for the identifier.
-
-        Returns:
-            str: A unique identifier for the span.
-        """
-        if granularity:
-            return f"{span['size']}_{span['font']}_{span['color']}"
-        else:
-            return f"{span['size']}"
+        return self._extract_page_content_from_blocks(self._get_text_blocks(page), size_tag_map)
 
-    def _extract_style(self, span: dict, granularity: bool) -> dict:
+    def _extract_page_content_from_blocks(self, blocks: List[dict], size_tag_map: Dict[tuple, str]) -> List[str]:
         """
-        Extracts the style from a text span.
+        Extracts content from the text blocks of a single PDF page.
 
         Args:
-            span (dict): Text span containing style information.
-            granularity (bool): Flag to determine the level of detail for the style extraction.
+            blocks (List[dict]): Text blocks returned by _get_text_blocks.
+            size_tag_map (Dict[tuple, str]): A map linking font styles to HTML tags.
 
         Returns:
-            dict: A dictionary representing the style of the span.
+            List[str]: A list of headers and paragraphs as HTML strings.
         """
-        if granularity:
-            return {'size': span['size'], 'font': span['font'], 'color': span['color']}
-        else:
-            return {'size': span['size']}
+        page_blocks = []
+        for block in blocks:
+            block_string = self._process_block(block, size_tag_map)
+            if block_string:
+                page_blocks.append(block_string)
+        return page_blocks
 
-    def _process_block(self, block: dict, size_tag_map: Dict[str, str]) -> List[str]:
+    def _process_block(self, block: dict, size_tag_map: Dict[tuple, str]) -> List[str]:
         """
         Processes a text block from a PDF page.
 
         Args:
             block (dict): A text block from the PDF.
-            size_tag_map (Dict[str, str]): A map linking font styles to HTML tags.
+            size_tag_map (Dict[tuple, str]): A map linking font styles to HTML tags.
 
         Returns:
             List[str]: Processed text block as a list of HTML strings.
         """
         block_strings = []
-        block_string = ""
+        buf = []  # Parts of the block currently being built, joined once the block closes
         previous_identifier = None
 
         for line in block["lines"]:
             for span in line["spans"]:
-                identifier = f"{span['size']}_{span['font']}_{span['color']}"  # Construct the identifier
-
-                if span['text'].strip():
-                    if self._is_new_block(identifier, previous_identifier):
-                        # Close the previous block if it exists
-                        if previous_identifier in size_tag_map:
-                            block_string += self._get_closing_tag(size_tag_map[previous_identifier])
-
-                        # Append the current block_string to block_strings and start a new block
-                        if block_string:
-                            block_strings.append(block_string)
-                            block_string = ""
-
-                        block_string = self._start_new_block(span, identifier, size_tag_map)
-                    else:
-                        # If not a new block, just append the text
-                        block_string += " " + span['text']
+                text = span['text']
+                if not text.strip():
+                    continue  # Whitespace-only spans neither extend nor start a block
+
+                identifier = (span['size'], span['font'], span['color'])  # Construct the identifier
+                if identifier != previous_identifier:
+                    # Close the previous block if it exists
+                    if previous_identifier in size_tag_map:
+                        opening_tag = size_tag_map[previous_identifier]
+                        buf.append(self._CLOSING.get(opening_tag) or self._get_closing_tag(opening_tag))
+
+                    # Append the current block to block_strings and start a new block
+                    block_string = "".join(buf)
+                    if block_string:
+                        block_strings.append(block_string)
+
+                    buf = self._start_new_block(span, identifier, size_tag_map)
+                else:
+                    # If not a new block, just append the text
+                    buf.append(" ")
+                    buf.append(text)
 
-                    previous_identifier = identifier
+                previous_identifier = identifier
 
         # Add the closing tag to the last block if needed and append it
         if previous_identifier in size_tag_map:
-            block_string += self._get_closing_tag(size_tag_map[previous_identifier])
+            opening_tag = size_tag_map[previous_identifier]
+            buf.append(self._CLOSING.get(opening_tag) or self._get_closing_tag(opening_tag))
 
+        block_string = "".join(buf)
         if block_string:
             block_strings.append(block_string)
 
         return block_strings
 
-    def _is_new_block(self, current_identifier: str, previous_identifier: str) -> bool:
-        """
-        Determine if a new block should start based on the change in identifiers.
-
-        Args:
-            current_identifier (str): Identifier for the current span, representing its style attributes.
-            previous_identifier (str): Identifier for the previous span, representing its style attributes.
-
-        Returns:
-            bool: True if the identifiers are different and a new block should start, False otherwise.
-        """
-        return current_identifier != previous_identifier
-
-    def _start_new_block(self, span: dict, identifier: str, size_tag_map: Dict[str, str]) -> str:
+    def _start_new_block(self, span: dict, identifier: tuple, size_tag_map: Dict[tuple, str]) -> List[str]:
         """
         Starts a new text block based on the given identifier and span.
 
         Args:
             span (dict): A text span from the PDF.
-            identifier (str): The unique identifier for the span's style.
-            size_tag_map (Dict[str, str]): A map linking font styles to HTML tags.
+            identifier (tuple): The unique identifier for the span's style.
+            size_tag_map (Dict[tuple, str]): A map linking font styles to HTML tags.
 
         Returns:
-            str: The starting string of a new text block.
+            List[str]: The starting parts of a new text block, to be joined when the block closes.
         """
-        # Get the closing tag for the previous block if it exists
-        closing_tag = ""
-        previous_identifier = None
-        if previous_identifier and previous_identifier in size_tag_map:
-            # Assuming _get_closing_tag method exists and returns the appropriate closing tag
-            closing_tag = self._get_closing_tag(size_tag_map[previous_identifier])
-
-        # Get the opening tag for the new block
-        opening_tag = size_tag_map.get(identifier, "")
-
-        # Return the combination of closing tag of the previous block, opening tag, and the span's text
-        return closing_tag + opening_tag + span['text']
+        # The previous block is closed by _process_block, so only the opening tag is needed here
+        return [size_tag_map.get(identifier, ""), span['text']]
 
     def _get_closing_tag(self, opening_tag: str) -> str:
         """
@@ -281,6 +316,30 @@ class PDFParser:
         return f'</{tag_type}>'
 
 
+@dataclass(slots=True)
+class Section:
+    """
+    A structured section of a document, used by HTMLToJsonConverter until the data is returned.
+
+    Attributes:
+        page (int): The page number the section starts on.
+        title (str): The section title.
+        text (str): The section body text.
+    """
+    page: int
+    title: str = ""
+    text: str = ""
+
+    def to_dict(self) -> Dict[str, Union[str, int]]:
+        """
+        Returns the section as a dictionary with 'title', 'text' and 'page' keys.
+
+        Returns:
+            Dict[str, Union[str, int]]: The section as a dictionary.
+        """
+        return {"title": self.title, "text": self.text, "page": self.page}
+
+
 class HTMLToJsonConverter:
     """
         A converter class that processes HTML data and converts it into JSON format.
@@ -299,6 +358,16 @@ class HTMLToJsonConverter:
         Returns:
             str: A JSON string representing the structured data.
         """
+        cleaned_data = self.process_list_to_structured()
+        return orjson.dumps(cleaned_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+
+    def process_list_to_structured(self) -> List[Dict[str, Union[str, int]]]:
+        """
+        Converts the data list of HTML content to structured data without serializing it.
+
+        Returns:
+            List[Dict[str, Union[str, int]]]: A list of dictionaries representing the structured data.
+        """
         structured_data = []
 
         for page_data in self.data_list:
@@ -307,84 +376,84 @@ class HTMLToJsonConverter:
         data_merged = self._merge_empty_structured_data(structured_data)
         data_no_duplicates = self._remove_duplicates(data_merged)
         cleaned_data = self._process_titles(data_no_duplicates)
-        return json.dumps(cleaned_data, ensure_ascii=False, indent=2)
+        return [section.to_dict() for section in cleaned_data]
 
-    def _process_titles(self, data: List[Dict[str, Union[str, int]]]) -> List[Dict[str, Union[str, int]]]:
+    def _process_titles(self, data: List[Section]) -> List[Section]:
         """
         Processes the titles in the structured data to ensure continuity and remove empty titles.
 
         Args:
-            data (List[Dict[str, Union[str, int]]]): A list of dictionaries representing structured data.
+            data (List[Section]): A list of sections representing structured data.
 
         Returns:
-            List[Dict[str, Union[str, int]]]: The processed list with updated titles.
+            List[Section]: The processed list with updated titles.
         """
-        i = 0
-        while i < len(data) - 1:
-            if not data[i]['text']:  # Check if 'text' is empty
-                data[i + 1]['title'] = data[i]['title'] + " " + data[i + 1]['title']
-                del data[i]  # Remove the current item
-            else:
-                i += 1  # Only increment if an item was not removed
-        return data
+        processed_entries = []
+        carry = None  # Title of preceding entries with empty 'text', pending a prefix
+        last_idx = len(data) - 1
+        for idx, entry in enumerate(data):
+            title = entry.title if carry is None else carry + " " + entry.title
+            if not entry.text and idx < last_idx:  # Check if 'text' is empty
+                carry = title
+                continue
+            if carry is not None:
+                entry.title = title
+                carry = None
+            processed_entries.append(entry)
+        return processed_entries
 
-    def _remove_duplicates(self, structured_data: List[Dict[str, Union[str, int]]]) -> List[Dict[str, Union[str, int]]]:
+    def _remove_duplicates(self, structured_data: List[Section]) -> List[Section]:
         """
         Removes duplicate entries from the structured data.
 
         Args:
-            structured_data (List[Dict[str, Union[str, int]]]): A list of dictionaries representing structured data.
+            structured_data (List[Section]): A list of sections representing structured data.
 
         Returns:
-            List[Dict[str, Union[str, int]]]: A list of dictionaries with duplicates removed.
+            List[Section]: A list of sections with duplicates removed.
         """
         unique_data = []
         seen = set()
         for item in structured_data:
-            # Creating a tuple of the dictionary's items to make it hashable
-            tuple_item = tuple(item.items())
+            # A tuple of the section's fields is a hashable key
+            tuple_item = (item.title, item.text, item.page)
             if tuple_item not in seen:
                 seen.add(tuple_item)
                 unique_data.append(item)
         return unique_data
 
-    def _merge_empty_structured_data(self, structured_data: List[Dict[str, Union[str, int]]]) -> List[
-        Dict[str, Union[str, int]]]:
+    def _merge_empty_structured_data(self, structured_data: List[Section]) -> List[Section]:
         """
         Merges entries in the structured data that have empty 'text' fields.
 
         Args:
-            structured_data (List[Dict[str, Union[str, int]]]): A list of dictionaries representing structured data.
+            structured_data (List[Section]): A list of sections representing structured data.
 
         Returns:
-            List[Dict[str, Union[str, int]]]: A list of dictionaries with merged entries.
+            List[Section]: A list of sections with merged entries.
         """
         processed_entries = []
-        skip_next = False
+        entries = iter(structured_data)
 
-        for i in range(len(structured_data)):
-            # Skip processing this entry if it's marked to be skipped
-            if skip_next:
-                skip_next = False
+        for entry in entries:
+            if entry.text != '':
+                processed_entries.append(entry)
                 continue
 
-            # Check if the current entry and the next entry (if exists) both have empty 'text' fields
-            if structured_data[i]['text'] == '' and (i + 1 < len(structured_data)) and structured_data[i + 1]['text'] == '':
+            # Check if the next entry (if exists) also has an empty 'text' field
+            next_entry = next(entries, None)
+            if next_entry is not None and next_entry.text == '':
                 # Merge the two entries
-                merged_entry = {
-                    'title': structured_data[i]['title'],
-                    'text': structured_data[i + 1]['title'],
-                    'page': structured_data[i]['page']
-                }
-                processed_entries.append(merged_entry)
-                skip_next = True  # Skip the next entry as it's already merged
+                processed_entries.append(Section(title=entry.title, text=next_entry.title, page=entry.page))
             else:
-                # Add the entry as it is
-                processed_entries.append(structured_data[i])
+                # Add the entry as it is, followed by the non-empty entry consumed above
+                processed_entries.append(entry)
+                if next_entry is not None:
+                    processed_entries.append(next_entry)
 
         return processed_entries
 
-    def _process_page_content(self, page_data: Dict[str, Union[int, List[str]]]) -> List[Dict[str, Union[str, int]]]:
+    def _process_page_content(self, page_data: Dict[str, Union[int, List[str]]]) -> List[Section]:
         """
         Processes the content of a single HTML page and structures it.
 
@@ -392,43 +461,43 @@ class HTMLToJsonConverter:
             page_data (Dict[str, Union[int, List[str]]]): A dictionary containing the HTML content of a single page.
 
         Returns:
-            List[Dict[str, Union[str, int]]]: A list of dictionaries each representing a structured section of the page.
+            List[Section]: A list of sections each representing a structured section of the page.
         """
         structured_page_data = []
-        current_section = {"title": "", "text": "", "page": page_data['page']}
+        current_section = Section(page=page_data['page'])
         title_set = False
 
         flat_page = self._flatten_list(page_data['content'])
         for item in flat_page:
-            if re.match(r'<h\d>', item):  # Check for heading tags
-                if current_section["title"] or current_section["text"]:
+            if _H_MATCH.match(item):  # Check for heading tags
+                if current_section.title or current_section.text:
                     structured_page_data.append(current_section)
-                    current_section = {"title": "", "text": "", "page": page_data['page']}
-                current_section["title"] = re.sub(r'<\/?h\d>', '', item)  # Remove HTML tags from title
+                    current_section = Section(page=page_data['page'])
+                current_section.title = _H_SUB.sub('', item)  # Remove HTML tags from title
                 title_set = True
-            elif re.match(r'<p>', item):  # Check for paragraph tags
-                paragraph_text = re.sub(r'<\/?p>', '', item)  # Remove HTML tags from paragraph
+            elif item.startswith('<p>'):  # Check for paragraph tags
+                paragraph_text = _P_SUB.sub('', item)  # Remove HTML tags from paragraph
                 if not title_set:  # If title hasn't been set, use the first paragraph as title
-                    current_section["title"] = paragraph_text
+                    current_section.title = paragraph_text
                     title_set = True
                 else:
-                    current_section["text"] += paragraph_text + " "
+                    current_section.text += paragraph_text + " "
 
-        if current_section["title"] or current_section["text"]:
+        if current_section.title or current_section.text:
             structured_page_data.append(current_section)
         return structured_page_data
 
-    def _flatten_list(self, nested_list: List[List[str]]) -> List[str]:
+    def _flatten_list(self, nested_list: List[List[str]]) -> Iterator[str]:
         """
-        Flattens a nested list of strings into a single list.
+        Lazily flattens a nested list of strings.
 
         Args:
             nested_list (List[List[str]]): A list containing nested lists of strings.
 
         Returns:
-            List[str]: A flattened list of strings.
+            Iterator[str]: An iterator over the strings of the nested lists, in order.
         """
-        return [item for sublist in nested_list for item in sublist]
+        return chain.from_iterable(nested_list)
 
 
 class MetadataEnhancedJsonConverter:
@@ -443,16 +512,16 @@ class MetadataEnhancedJsonConverter:
         document (str): The document name, extracted from the first entry of the JSON data.
     """
 
-    def __init__(self, json_string: str, file_path: str, base_url: str) -> None:
+    def __init__(self, json_data: List[Dict[str, Any]], file_path: str, base_url: str) -> None:
         """
-        Initialize the MetadataEnhancedJsonConverter with JSON string, file path, and base URL.
+        Initialize the MetadataEnhancedJsonConverter with structured data, file path, and base URL.
 
         Args:
-            json_string (str): The JSON string to be processed.
+            json_data (List[Dict[str, Any]]): The structured data to be processed.
             file_path (str): The file path of the PDF document.
             base_url (str): The base URL for link generation.
         """
-        self.json_data = json.loads(json_string)
+        self.json_data = json_data
         self.file_name = os.path.basename(file_path)
         self.base_url = base_url
         if self.json_data and isinstance(self.json_data, list):
@@ -480,4 +549,4 @@ class MetadataEnhancedJsonConverter:
             str: The enhanced JSON data in string format.
         """
         self.enhance_json()
-        return json.dumps(self.json_data, ensure_ascii=False, indent=2)
+        return orjson.dumps(self.json_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
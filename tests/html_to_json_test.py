@@ -1,6 +1,6 @@
 import pytest
 import json
-from src.pdf_to_json import HTMLToJsonConverter
+from src.pdf_to_json import HTMLToJsonConverter, Section
 
 
 # Sample data for testing
@@ -62,3 +62,42 @@ def test_merge_empty_structured_data():
     # Verify that merging does not result in the loss of all entries
     assert len(result) > 0
 
+
+def test_process_titles_merges_empty_text_entries():
+    converter = HTMLToJsonConverter(test_data)
+    data = [
+        Section(title='A', text='', page=1),
+        Section(title='B', text='', page=1),
+        Section(title='C', text='body', page=1),
+        Section(title='D', text='more', page=2),
+        Section(title='E', text='', page=2),
+    ]
+    result = converter._process_titles(data)
+
+    assert [entry.title for entry in result] == ['A B C', 'D', 'E']
+    assert [entry.text for entry in result] == ['body', 'more', '']
+
+def test_process_list_to_structured_matches_json():
+    converter = HTMLToJsonConverter(test_data)
+    result = converter.process_list_to_structured()
+
+    assert isinstance(result, list)
+    assert result == json.loads(converter.process_list_to_json())
+
+def test_merge_empty_structured_data_pairs_empty_entries():
+    converter = HTMLToJsonConverter(test_data)
+    data = [
+        Section(title='A', text='', page=1),
+        Section(title='B', text='', page=1),
+        Section(title='C', text='', page=1),
+        Section(title='D', text='body', page=1),
+        Section(title='E', text='', page=2),
+    ]
+    result = converter._merge_empty_structured_data(data)
+
+    assert result == [
+        Section(title='A', text='B', page=1),
+        Section(title='C', text='', page=1),
+        Section(title='D', text='body', page=1),
+        Section(title='E', text='', page=2),
+    ]
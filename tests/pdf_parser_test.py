@@ -34,8 +34,8 @@ def test_extract_fonts():
     doc = fitz.open(path)  # Use a real or a mocked PDF path
     parser = PDFParser(doc)
     page = doc[0]  # Assuming the PDF has at least one page
-    font_counts, styles = parser._extract_fonts(page)
-    assert len(font_counts) > 0  # Ensure the dictionary is not empty
+    primary_identifier, styles = parser._extract_fonts(page)
+    assert primary_identifier in styles  # Ensure the primary font is one of the page's styles
     assert isinstance(styles, dict)
     assert len(styles) > 0  # Ensure the dictionary is not empty
 
@@ -44,7 +44,27 @@ def test_extract_headers_and_paragraphs():
     doc = fitz.open(path)  # Use a real or a mocked PDF path
     parser = PDFParser(doc)
     page = doc[0]  # Assuming the PDF has at least one page
-    size_tag_map = {"example_identifier": "<p>"}  # Mocked size_tag_map
+    size_tag_map = {(0.0, "example_font", 0): "<p>"}  # Mocked size_tag_map
     headers_paragraphs = parser._extract_page_content(page, size_tag_map)
     assert isinstance(headers_paragraphs, list)
     assert len(headers_paragraphs) > 0
+
+
+def test_extract_from_blocks_matches_page_helpers():
+    doc = fitz.open(path)
+    parser = PDFParser(doc)
+    page = doc[0]
+    blocks = parser._get_text_blocks(page)
+    assert parser._extract_fonts_from_blocks(blocks) == parser._extract_fonts(page)
+    primary_identifier, styles = parser._extract_fonts(page)
+    size_tag_map = parser._create_size_tag_map(primary_identifier, styles)
+    assert parser._extract_page_content_from_blocks(blocks, size_tag_map) == parser._extract_page_content(page, size_tag_map)
+
+
+def test_size_tag_map_cache_reused():
+    doc = fitz.open(path)
+    parser = PDFParser(doc)
+    primary_identifier, styles = parser._extract_fonts(doc[0])
+    first = parser._get_size_tag_map(primary_identifier, styles)
+    assert first == parser._create_size_tag_map(primary_identifier, styles)
+    assert parser._get_size_tag_map(primary_identifier, styles) is first